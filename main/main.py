@@ -1,151 +1,665 @@
 import sys
-import time
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+try:
+    from requests_cache import CachedSession  # pip install requests-cache (optional on-disk HTTP cache)
+except ImportError:
+    CachedSession = None
 import openpyxl
-from openpyxl import Workbook
-from openpyxl.utils.exceptions import IllegalCharacterError
-from datetime import date, datetime
+import xlsxwriter  # pip install xlsxwriter (streaming .xlsx writer)
+from collections import OrderedDict
+from datetime import date, datetime, time as clock_time, timedelta
+import csv
 import importlib
+import json
 import os
+import queue
+import threading
+import time
+import multiprocessing
+import sqlite3
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Callable
+from itertools import chain
+from urllib.parse import urlsplit
 import pyperclip  # pip install pyperclip if not already installed
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout, QHBoxLayout,
-    QWidget, QLabel, QMessageBox, QProgressBar, QTextEdit, QComboBox,
-    QRadioButton, QGroupBox
+    QWidget, QLabel, QMessageBox, QProgressBar, QPlainTextEdit, QComboBox,
+    QRadioButton, QGroupBox, QCheckBox
 )
 from PyQt6.QtGui import QPalette, QColor
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from parsers._util import build_tree, header_charset
+
+# Detail pages fetched in parallel, by one pool for the whole run that every company shares
+DETAIL_WORKERS = 8
+# Companies scraped at the same time
+COMPANY_WORKERS = 4
+# Detail requests that may be in flight to one host at once
+HOST_CONCURRENCY = 4
+# Per-host pause after each detail request: a quarter of its latency, clamped to this range (seconds)
+POLITE_DELAY_MIN = 0.05
+POLITE_DELAY_MAX = 1.0
+# Sustained request rate per host (requests/second) once the first HOST_CONCURRENCY have gone out
+HOST_RATE = 3.0
+# Worker processes for listing and detail parsing (0 = parse on the fetching threads, under the GIL).
+# Only worth raising when profiling shows parsing, not the network, dominates a run.
+PARSE_PROCESSES = 0
+# Detail pages kept in memory for the rest of a run, so a URL listed twice (or by two companies) is fetched once
+URL_CACHE_SIZE = 512
+
+# Coalesce cross-thread Qt signals: at most ~10 progress and ~20 per-job status updates per second
+EMIT_INTERVAL = 0.1
+STATUS_INTERVAL = 0.05
+# Log lines are queued by the worker and drained by a GUI timer at this period (milliseconds)
+LOG_DRAIN_MS = 200
+# The log widget keeps only the newest lines; older ones are dropped as new ones arrive.
+# "Copy Logs" copies the whole run from a separate list, not from the widget.
+LOG_MAX_LINES = 5000
+
+# Characters an .xlsx cell cannot hold: C0 controls except tab/LF/CR, lone surrogates, U+FFFE/U+FFFF.
+# str.translate drops them in one C-level pass and never raises.
+_ILLEGAL = dict.fromkeys(c for c in range(0x20) if c not in (0x09, 0x0A, 0x0D))
+_ILLEGAL.update(dict.fromkeys(range(0xD800, 0xE000)))
+_ILLEGAL.update(dict.fromkeys((0xFFFE, 0xFFFF)))
+ILLEGAL_TABLE = str.maketrans(_ILLEGAL)
+
+SHEET_HEADER = ["Date", "Time", "Company", "Role", "Role description"]
+# Scrapify.xlsx is generated from the history on every save, so its layout is defined here rather
+# than kept from the old file: the shipped workbook's widths (Date … Role location), fonts, wrapped
+# top-left cells, blue bold header and the red highlight of duplicate roles/descriptions.
+SHEET_COLUMN_WIDTHS = (10, 7.14, 26.71, 64.71, 134.71, 34.57)
+SHEET_CELL_FORMAT = {"font_name": "Garet Book", "font_size": 11, "text_wrap": True, "align": "left", "valign": "top"}
+SHEET_HEADER_FORMAT = {**SHEET_CELL_FORMAT, "bold": True, "font_color": "#FFFFFF", "bg_color": "#2F5597"}
+SHEET_COLUMN_NUM_FORMATS = {0: "mm/dd/yyyy", 1: "hh:mm:ss"}  # for dates/times typed into the sheet by hand
+SHEET_DUPLICATE_FORMAT = {"font_color": "#9C0006", "bg_color": "#FFC7CE"}
+SHEET_DUPLICATE_COLUMNS = (3, 4)  # Role .. Role description
+# Above this many new rows the results are appended to Scrapify.csv instead of the workbook
+CSV_AUTO_THRESHOLD = 500
+# Every scraped job is appended here as soon as it completes and the file is removed once the
+# results are saved, so a crashed or killed run leaves its rows behind for the next run to save
+JOURNAL_FILE = "Scrapify.jsonl"
+# Every saved job, oldest first. Scrapify.xlsx is regenerated from it on each save instead of being
+# read back; if the workbook is edited by hand (its mtime no longer matches the last export) the
+# workbook wins and is re-imported. A missing workbook never clears the history: the next save
+# regenerates it.
+HISTORY_FILE = "Scrapify.sqlite"
+
+HEADERS_DEFAULT = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
+    # "gzip,deflate", plus "br" only when a brotli decoder is installed (pip install brotli)
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+
+# On-disk HTTP cache: listings change often, posted job descriptions rarely.
+# Server Cache-Control/ETag headers take precedence; a failing site serves its last good page.
+LISTING_CACHE_TTL = timedelta(minutes=30)
+DETAIL_CACHE_TTL = timedelta(hours=6)
+# (connect, read): a dead host fails fast instead of holding a pool thread for the whole read timeout
+REQUEST_TIMEOUT = (5, 20)
+LISTING_FETCH_KW = {"expire_after": LISTING_CACHE_TTL} if CachedSession else {}
+
+
+def make_session():
+    """One pooled keep-alive session for every request, so TCP/TLS setup is paid once per host."""
+    if CachedSession:
+        session = CachedSession(
+            cache_name=".scrapify_cache",
+            backend="sqlite",
+            expire_after=DETAIL_CACHE_TTL,
+            stale_if_error=True,
+            cache_control=True
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,  # hosts whose connection pools are kept
+        # Keep-alive connections per host, sized to the most requests that can be in flight to
+        # one host (its detail slots plus a listing from every company thread). Blocking on a
+        # full pool reuses a warm connection instead of opening, then discarding, an extra one.
+        pool_maxsize=HOST_CONCURRENCY + COMPANY_WORKERS,
+        pool_block=True,
+        # Rate limiting (429, honouring Retry-After) and transient server errors are retried with
+        # backoff; the last response still reaches raise_for_status() so the log shows the real code
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS_DEFAULT)
+    return session
+
+
+SESSION = make_session()
+
+
+@dataclass(slots=True, frozen=True)
+class SiteCfg:
+    """A parser module's CONFIG plus its two parse functions; unknown CONFIG keys fail at load time."""
+    url: str
+    listing_parser: Callable
+    detail_parser: Callable
+    headers: dict = field(default_factory=dict)
+    note: str | None = None
+    listing_tree: str = "soup"
+    detail_tree: str = "soup"
+    listing_strainer: object = None
+    detail_strainer: object = None
+
+
+# Cached per module name, so later runs (and every page parsed in a pool process) skip the import and
+# build. Failures are not cached, and a malformed module is dropped from sys.modules, so a parser file
+# added or fixed between runs is picked up.
+@lru_cache(maxsize=None)
+def load_site(module_name: str) -> SiteCfg:
+    """ImportError if parsers/<module_name>.py is missing; AttributeError/TypeError if it is malformed."""
+    module = importlib.import_module(f"parsers.{module_name}")
+    try:
+        return SiteCfg(listing_parser=module.listing_parser, detail_parser=module.detail_parser, **module.CONFIG)
+    except (AttributeError, TypeError):
+        sys.modules.pop(module.__name__, None)
+        raise
+
+
+def run_parser(parser, tree_kind, strainer, content: bytes, encoding=None):
+    return parser(build_tree(content, tree_kind, strainer, encoding))
+
+
+def parse_listing(module_name: str, content: bytes, encoding=None):
+    """Listing parse keyed by parser module name, so it can be pickled into a process pool."""
+    site = load_site(module_name)
+    return run_parser(site.listing_parser, site.listing_tree, site.listing_strainer, content, encoding)
+
+
+def parse_detail(module_name: str, content: bytes, encoding=None):
+    """Detail parse keyed by parser module name, so it can be pickled into a process pool."""
+    site = load_site(module_name)
+    return run_parser(site.detail_parser, site.detail_tree, site.detail_strainer, content, encoding)
+
+
+def parse_detail_in(pool, module_name: str, content: bytes, encoding=None):
+    """Ship one page to the process pool; the calling fetch thread just waits (GIL released)."""
+    return pool.submit(parse_detail, module_name, content, encoding).result()
+
+
+def open_history():
+    con = sqlite3.connect(HISTORY_FILE)
+    # extra: JSON list of the cells right of "Role description" in rows imported from the workbook
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS jobs (date TEXT, time TEXT, company TEXT, role TEXT, description TEXT, extra TEXT)"
+    )
+    con.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+    return con
+
+
+def _xlsx_mtime():
+    try:
+        return os.stat("Scrapify.xlsx").st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _sheet_value(value):
+    """sqlite has no date/time types: cells Excel turned into dates/times are stored as the text this app writes."""
+    if isinstance(value, date):
+        return value.strftime("%m/%d/%Y")
+    if isinstance(value, clock_time):
+        return value.strftime("%H:%M:%S")
+    return value
+
+
+def _history_row(cells):
+    """Sheet row -> jobs row: the SHEET_HEADER columns, then any further non-empty cells kept as JSON."""
+    cells = list(map(_sheet_value, cells))
+    cells += [None] * (len(SHEET_HEADER) - len(cells))
+    extra = cells[len(SHEET_HEADER):]
+    while extra and extra[-1] is None:
+        extra.pop()
+    return (*cells[:len(SHEET_HEADER)], json.dumps(extra, ensure_ascii=False) if extra else None)
+
+
+def sync_history(con):
+    """Re-import Scrapify.xlsx into the history if it exists and changed since the last export (or was never imported)."""
+    row = con.execute("SELECT value FROM meta WHERE key = 'xlsx_mtime'").fetchone()
+    mtime = _xlsx_mtime()
+    # Moved, renamed or briefly locked away (e.g. by a sync client): keep the history as it is
+    if mtime is None or (row[0] if row else None) == mtime:
+        return
+    # data_only: a formula cell comes back as its last computed value
+    wb = openpyxl.load_workbook("Scrapify.xlsx", read_only=True, data_only=True)
+    sheet_rows = wb["Sheet1"].iter_rows(values_only=True)
+    header = next(sheet_rows, None)
+    rows = [_history_row(row) for row in sheet_rows if any(cell is not None for cell in row)]
+    wb.close()
+    if header:
+        # The user's own header row (renamed or extra columns included) is written back on export
+        while header and header[-1] is None:
+            header = header[:-1]
+        header = json.dumps([_sheet_value(cell) for cell in header], ensure_ascii=False)
+    with con:
+        con.execute("DELETE FROM jobs")
+        con.executemany("INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?)", reversed(rows))  # the sheet is newest first
+        con.execute("INSERT OR REPLACE INTO meta VALUES ('xlsx_mtime', ?)", (mtime,))
+        con.execute("INSERT OR REPLACE INTO meta VALUES ('header', ?)", (header,))
+
+
+def history_header(con):
+    """Header row for the exported sheet: the workbook's own, else SHEET_HEADER."""
+    row = con.execute("SELECT value FROM meta WHERE key = 'header'").fetchone()
+    return json.loads(row[0]) if row and row[0] else SHEET_HEADER
+
+
+def saved_job_keys():
+    """(Company, Role) of every job already in the history / Scrapify.csv."""
+    con = open_history()
+    try:
+        sync_history(con)
+        keys = set(con.execute("SELECT company, role FROM jobs"))
+    finally:
+        con.close()
+    try:
+        with open("Scrapify.csv", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            keys.update((row[2], row[3]) for row in reader if len(row) >= 4)
+    except FileNotFoundError:
+        pass
+    return keys
+
+
+def read_journal():
+    """Rows left in the journal by an interrupted run, as sheet rows."""
+    try:
+        with open(JOURNAL_FILE, encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+    rows = []
+    for line in lines:
+        try:
+            job = json.loads(line)
+            rows.append((job["date"], job["time"], job["company"], job["title"], job["desc"]))
+        except (ValueError, KeyError):
+            continue  # last line cut short by the crash
+    return rows
 
 # ---------------------------------------------------------------------------
-# WORKER THREAD (unchanged)
+# WORKER (runs on a QThreadPool thread)
 # ---------------------------------------------------------------------------
 
-class Worker(QThread):
+class WorkerSignals(QObject):
     progress = pyqtSignal(int)
     status = pyqtSignal(str)
-    log = pyqtSignal(str)
     finished = pyqtSignal(bool, str, list)  # success, message, errors
 
-    def __init__(self, selected_companies: list):
+
+class Worker(QRunnable):
+    """One scrape run. A QRunnable rather than a QThread, so runs reuse the global pool's threads."""
+
+    def __init__(self, selected_companies: list, csv_output: bool = False):
         super().__init__()
+        # QRunnable is not a QObject and cannot own signals; same names as before for the GUI
+        self.signals = WorkerSignals()
+        self.progress = self.signals.progress
+        self.status = self.signals.status
+        self.finished = self.signals.finished
+        # Log lines go through a lock-free queue that the GUI drains on a timer, not a signal per line
+        self.log_queue = queue.SimpleQueue()
         self.selected_companies = selected_companies
+        self.csv_output = csv_output
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+        self._host_next = {}  # host -> monotonic time its next request token becomes free
+        self._url_cache = OrderedDict()  # detail URL -> Future of (body, charset), least recently used first
+        self._url_cache_lock = threading.Lock()
+        self._last_progress = -1
+        self._last_emit = 0.0
+        self._last_status = 0.0
+        # Companies are scraped on several threads; this serialises the throttling state above
+        self._emit_lock = threading.Lock()
+
+    def _log(self, line: str):
+        self.log_queue.put(line)
+
+    def _emit_progress(self, value: int, force: bool = False):
+        """Throttled progress update; `force` for milestones that must always show."""
+        with self._emit_lock:
+            now = time.monotonic()
+            if not force and (value == self._last_progress or now - self._last_emit < EMIT_INTERVAL):
+                return
+            self.progress.emit(value)
+            self._last_progress = value
+            self._last_emit = now
+
+    def _emit_status(self, text: str):
+        """Per-job status line; intermediate ones are dropped when jobs complete faster than the GUI needs."""
+        with self._emit_lock:
+            now = time.monotonic()
+            if now - self._last_status >= STATUS_INTERVAL:
+                self.status.emit(text)
+                self._last_status = now
+
+    def _host_slot(self, host: str):
+        """Per-host semaphore keeping the detail pool polite towards a single job board."""
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(HOST_CONCURRENCY)
+            return self._host_slots[host]
+
+    def _host_token_wait(self, host: str) -> float:
+        """Seconds until this host's next token: with the slots, a HOST_CONCURRENCY-deep bucket refilled at HOST_RATE."""
+        with self._host_slots_lock:
+            now = time.monotonic()
+            due = max(now, self._host_next.get(host, now))
+            self._host_next[host] = due + 1 / HOST_RATE
+            return due - now
+
+    def _fetch_detail(self, detail_url, headers, parse):
+        """Runs on a pool thread: fetch + parse one detail page -> (text, served from cache). Must not touch Qt signals."""
+        # The first request for a URL owns its future; duplicates (even ones still in flight) wait on it
+        with self._url_cache_lock:
+            page = self._url_cache.get(detail_url)
+            owner = page is None
+            if owner:
+                page = self._url_cache[detail_url] = Future()
+                if len(self._url_cache) > URL_CACHE_SIZE:
+                    self._url_cache.popitem(last=False)
+            else:
+                self._url_cache.move_to_end(detail_url)
+        if not owner:
+            return parse(*page.result()), True
+        try:
+            body, charset, from_cache = self._download(detail_url, headers)
+        except BaseException as e:
+            page.set_exception(e)
+            with self._url_cache_lock:
+                if self._url_cache.get(detail_url) is page:
+                    del self._url_cache[detail_url]
+            raise
+        page.set_result((body, charset))
+        return parse(body, charset), from_cache
+
+    def _download(self, detail_url, headers):
+        """GET one detail page inside its host slot -> (body, charset, served from the HTTP cache)."""
+        host = urlsplit(detail_url).netloc
+        with self._host_slot(host):
+            t0 = time.monotonic()
+            detail_resp = SESSION.get(detail_url, headers=headers, timeout=REQUEST_TIMEOUT)
+            # Politeness delay, held inside the host slot: the host's rate token or a quarter of the
+            # latency (how loaded the server looks), whichever is longer.
+            # Pages served from the HTTP cache never reached the server, so they skip it.
+            from_cache = getattr(detail_resp, "from_cache", False)
+            if not from_cache:
+                latency_delay = min(POLITE_DELAY_MAX, max(POLITE_DELAY_MIN, 0.25 * (time.monotonic() - t0)))
+                time.sleep(max(latency_delay, self._host_token_wait(host)))
+        detail_resp.raise_for_status()
+        return detail_resp.content, header_charset(detail_resp.headers), from_cache
 
     def run(self):
         errors = []
-        all_jobs = []  # (date, company, title, description)
         today_date = date.today().strftime("%m/%d/%Y")
         total = len(self.selected_companies)
-        for idx, company in enumerate(self.selected_companies, 1):
+        # One fetch pool for the whole run, shared by every company
+        detail_pool = ThreadPoolExecutor(max_workers=DETAIL_WORKERS)
+        parse_pool = ProcessPoolExecutor(max_workers=PARSE_PROCESSES) if PARSE_PROCESSES else None
+        # Hot names bound once: the loops below call them for every company and every job
+        emit_status = self._emit_status
+        emit_progress = self._emit_progress
+        get = SESSION.get
+        recovered = read_journal()
+        if recovered:
+            self._log(f"ℹ Recovered {len(recovered)} unsaved job(s) from an interrupted run")
+        # Postings already saved by an earlier run are not fetched again
+        saved = saved_job_keys()
+        saved.update((row[2], row[3]) for row in recovered)
+        # Line-buffered, so each job is on disk as soon as it is scraped
+        journal = open(JOURNAL_FILE, "a", encoding="utf-8", buffering=1)
+        journal_lock = threading.Lock()
+        dumps = json.dumps
+        # Each company's work done in permille (0..1000), plus their running sum; overall scraping
+        # progress runs 0 -> 80. Integers only, so the per-job update is a subtraction and a floor division.
+        company_done = [0] * total
+        done_sum = [0]
+        progress_scale = 1000 * total
+        progress_lock = threading.Lock()
+
+        def company_progress(idx, permille, force=False):
+            with progress_lock:
+                done_sum[0] += permille - company_done[idx]
+                company_done[idx] = permille
+                value = 80 * done_sum[0] // progress_scale
+            emit_progress(value, force=force)
+
+        def scrape_company(idx, company):
+            """Runs on a company pool thread. Returns the company's (company, titles, descriptions) batch or None."""
+            self._log(f"\n── {company} ({idx + 1}/{total}) ──")
+            if total > 1:
+                # Lines are logged as they happen; with companies side by side they interleave,
+                # so each one names its company
+                tag = f"[{company}] "
+                log = lambda line: self._log(tag + line.lstrip(" "))
+            else:
+                log = self._log
+            try:
+                return _scrape_company(idx, company, log)
+            finally:
+                company_progress(idx, 1000, force=True)
+
+        def _scrape_company(idx, company, log):
             module_name = company.lower().replace(" ", "_")
             try:
-                module = importlib.import_module(f"parsers.{module_name}")
-                cfg = module.CONFIG
-                listing_parser = module.listing_parser
-                detail_parser = module.detail_parser
+                site = load_site(module_name)
             except ImportError:
                 err = f"{company}: No parser file (parsers/{module_name}.py)"
                 errors.append(err)
-                self.log.emit(f"⚠ {err} — skipping.")
-                continue
-            except AttributeError as e:
-                err = f"{company}: Invalid parser file – {str(e)} (missing CONFIG/listing_parser/detail_parser?)"
+                log(f"⚠ {err} — skipping.")
+                return None
+            except (AttributeError, TypeError) as e:
+                err = f"{company}: Invalid parser file – {str(e)} (missing CONFIG/listing_parser/detail_parser or unknown CONFIG key?)"
                 errors.append(err)
-                self.log.emit(f"✗ {err}")
-                continue
-            self.log.emit(f"\n── {company} ({idx}/{total}) ──")
-            if cfg.get("note"):
-                self.log.emit(f" ℹ {cfg['note']}")
-            base_progress = int((idx - 1) / total * 80)
-            company_progress_range = int(80 / total) if total > 0 else 0
+                log(f"✗ {err}")
+                return None
+            headers = site.headers
+            if site.note:
+                log(f" ℹ {site.note}")
             # Fetch listing page
+            # Company-level status always shows; only the per-job updates are throttled
             self.status.emit(f"[{company}] Fetching listings page…")
             try:
-                response = requests.get(
-                    cfg["url"],
-                    headers=cfg.get("headers", {}),
-                    timeout=30
+                response = get(
+                    site.url,
+                    headers=headers,
+                    timeout=REQUEST_TIMEOUT,
+                    **LISTING_FETCH_KW
                 )
                 response.raise_for_status()
             except Exception as e:
                 err = f"{company}: Failed to fetch listing page: {str(e)}"
                 errors.append(err)
-                self.log.emit(f" ✗ {err}")
-                continue
-            self.progress.emit(base_progress + int(company_progress_range * 0.15))
-            soup = BeautifulSoup(response.text, "html.parser")
+                log(f" ✗ {err}")
+                return None
+            company_progress(idx, 150, force=True)
             try:
-                job_list = listing_parser(soup)
+                if parse_pool:
+                    # With companies running side by side, their listing parses can overlap too
+                    job_list = parse_pool.submit(
+                        parse_listing, module_name, response.content, header_charset(response.headers)
+                    ).result()
+                else:
+                    job_list = run_parser(
+                        site.listing_parser, site.listing_tree, site.listing_strainer,
+                        response.content, header_charset(response.headers)
+                    )
             except Exception as e:
                 err = f"{company}: Listing parser error: {str(e)}"
                 errors.append(err)
-                self.log.emit(f" ✗ {err}")
-                continue
+                log(f" ✗ {err}")
+                return None
             num_jobs = len(job_list)
             if num_jobs == 0:
-                self.log.emit(f" ⚠ No job postings found.")
-                self.progress.emit(base_progress + company_progress_range)
-                continue
-            self.log.emit(f" Found {num_jobs} posting(s)")
-            self.progress.emit(base_progress + int(company_progress_range * 0.25))
-            # Fetch details
-            detail_step = (company_progress_range * 0.60) / num_jobs if num_jobs else 0
-            for i, (title, detail_url) in enumerate(job_list, 1):
-                self.status.emit(f"[{company}] {i}/{num_jobs}: {title}")
+                log(f" ⚠ No job postings found.")
+                return None
+            log(f" Found {num_jobs} posting(s)" + (" (cached)" if getattr(response, "from_cache", False) else ""))
+            job_list = [(title, url) for title, url in job_list if (company, title) not in saved]
+            if len(job_list) < num_jobs:
+                log(f" ↷ {num_jobs - len(job_list)} already saved, skipped")
+                num_jobs = len(job_list)
+                if num_jobs == 0:
+                    return None
+            company_progress(idx, 250, force=True)
+            # Fetch details concurrently; signals are emitted only from the company threads
+            found = {}  # listing position -> (title, description)
+            # Per-company invariants, resolved once rather than per job
+            if parse_pool:
+                parse = partial(parse_detail_in, parse_pool, module_name)
+            else:
+                parse = partial(
+                    run_parser, site.detail_parser, site.detail_tree, site.detail_strainer
+                )
+            fetch = self._fetch_detail
+            submit = detail_pool.submit
+            futures = {
+                submit(fetch, detail_url, headers, parse): (pos, title)
+                for pos, (title, detail_url) in enumerate(job_list)
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                pos, title = futures[future]
+                emit_status(f"[{company}] {i}/{num_jobs}: {title}")
                 try:
-                    detail_resp = requests.get(
-                        detail_url,
-                        headers=cfg.get("headers", {}),
-                        timeout=30
-                    )
-                    detail_resp.raise_for_status()
-                    detail_soup = BeautifulSoup(detail_resp.text, "html.parser")
-                    description = detail_parser(detail_soup)
-                    if description.strip():
-                        all_jobs.append((today_date, company, title, description.strip()))
-                        self.log.emit(f" ✔ {title}")
+                    description, from_cache = future.result()
+                    description = description.translate(ILLEGAL_TABLE).strip()
+                    if description:
+                        found[pos] = (title, description)
+                        line = dumps({
+                            "date": today_date, "time": datetime.now().strftime("%H:%M:%S"),
+                            "company": company, "title": title, "desc": description
+                        }, ensure_ascii=False) + "\n"
+                        with journal_lock:
+                            journal.write(line)
+                        log(f" ✔ {title} (cached)" if from_cache else f" ✔ {title}")
                     else:
-                        self.log.emit(f" ✗ No description: {title}")
+                        log(f" ✗ No description: {title}")
                 except Exception as e:
                     err = f"{company} ({title}): {str(e)}"
                     errors.append(err)
-                    self.log.emit(f" ✗ {err}")
-                self.progress.emit(base_progress + int(company_progress_range * 0.25 + i * detail_step))
-                time.sleep(0.4)
-            self.progress.emit(base_progress + company_progress_range)
-        # Save to Excel
-        if not all_jobs:
+                    log(f" ✗ {err}")
+                company_progress(idx, 250 + 750 * i // num_jobs)
+            if not found:
+                return None
+            # Keep the listing order in the sheet, not the completion order
+            order = sorted(found)
+            return company, [found[p][0] for p in order], [found[p][1] for p in order]
+
+        # Companies live on independent hosts, so they are scraped side by side
+        with ThreadPoolExecutor(max_workers=max(1, min(COMPANY_WORKERS, total))) as company_pool:
+            company_futures = [
+                company_pool.submit(scrape_company, idx, company)
+                for idx, company in enumerate(self.selected_companies)
+            ]
+            # Columnar results: one (company, titles, descriptions) batch per company, so the
+            # run-wide date and the per-company name are stored once rather than on every row.
+            # Collected in selection order, whatever order the companies finished in.
+            batches = [batch for batch in (f.result() for f in company_futures) if batch]
+        num_collected = sum(len(titles) for _, titles, _ in batches)
+        detail_pool.shutdown()
+        if parse_pool:
+            parse_pool.shutdown()
+        journal.close()
+        num_collected += len(recovered)
+        if not num_collected:
+            os.remove(JOURNAL_FILE)
             self.finished.emit(True, "No jobs collected.", errors)
             return
+        # Big runs go to CSV: appending rows is O(new rows), whereas the xlsx is rebuilt every save
+        if self.csv_output or num_collected > CSV_AUTO_THRESHOLD:
+            file_name = self._save_csv(batches, today_date, recovered)
+        else:
+            file_name = self._save_excel(batches, today_date, recovered)
+        # Everything in the journal is in the output file now
+        os.remove(JOURNAL_FILE)
+        emit_progress(100, force=True)
+        self.finished.emit(True, f"Added {num_collected} job(s) to {file_name}.", errors)
+
+    def _save_csv(self, batches, today_date, recovered=()):
+        self.status.emit("Saving to CSV…")
+        file_name = "Scrapify.csv"
+        now = datetime.now().strftime("%H:%M:%S")
+        is_new = not os.path.exists(file_name)
+        with open(file_name, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if is_new:
+                writer.writerow(SHEET_HEADER)
+            for company, titles, descriptions in batches:
+                writer.writerows((today_date, now, company, t, d) for t, d in zip(titles, descriptions))
+            writer.writerows(recovered)
+        return file_name
+
+    def _save_excel(self, batches, today_date, recovered=()):
         self.status.emit("Saving to Excel…")
         file_name = "Scrapify.xlsx"
-        sheet_name = "Sheet1"
+        # New rows are one INSERT batch into the history; the sheet is then rebuilt from it in a
+        # single streaming pass (no insert_rows, and the old workbook is never read back)
+        con = open_history()
         try:
-            wb = openpyxl.load_workbook(file_name)
-        except FileNotFoundError:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = sheet_name
-            ws.append(["Date", "Time", "Company", "Role", "Role description"])
-        ws = wb[sheet_name]
-        insert_step = 15 / len(all_jobs) if all_jobs else 0
-        prog = 80
-        for j, job in enumerate(reversed(all_jobs), 1):
-            ws.insert_rows(2)
-            try:
-                ws.cell(row=2, column=1, value=job[0]) # Date
-                ws.cell(row=2, column=2, value=datetime.now().strftime("%H:%M:%S")) # Time
-                ws.cell(row=2, column=3, value=job[1]) # Company
-                ws.cell(row=2, column=4, value=job[2]) # Role
-                ws.cell(row=2, column=5, value=job[3]) # Role description
-            except IllegalCharacterError:
-                cleaned = "".join(c for c in job[3] if c.isprintable())
-                ws.cell(row=2, column=5, value=cleaned)
-            prog += insert_step
-            self.progress.emit(int(prog))
-        wb.save(file_name)
-        self.progress.emit(100)
-        self.finished.emit(True, f"Added {len(all_jobs)} job(s) to {file_name}.", errors)
+            sync_history(con)  # picks up hand edits to the workbook made since the last save
+            now = datetime.now().strftime("%H:%M:%S")  # one save, one timestamp (as in _save_csv)
+            new_rows = [
+                (today_date, now, company, title, description)
+                for company, titles, descriptions in batches
+                for title, description in zip(titles, descriptions)
+            ]
+            # Stored oldest first: rows recovered from an interrupted run are older than this run's,
+            # so reading back newest first puts this run's jobs on top, in scrape order.
+            # The transaction stays open until the workbook is in place.
+            con.executemany(
+                "INSERT INTO jobs (date, time, company, role, description) VALUES (?, ?, ?, ?, ?)",
+                chain(reversed(recovered), reversed(new_rows))
+            )
+            # constant_memory streams each finished row to disk instead of holding the sheet in RAM.
+            # Written beside the original and swapped in at the end, so a failed save never truncates it.
+            tmp_name = file_name.replace(".xlsx", ".tmp.xlsx")
+            wb = xlsxwriter.Workbook(tmp_name, {
+                "constant_memory": True,
+                "strings_to_urls": False,
+                "strings_to_formulas": False,  # scraped text starting with "=" stays text
+            })
+            ws = wb.add_worksheet("Sheet1")
+            header = history_header(con)
+            cell_format = wb.add_format(SHEET_CELL_FORMAT)
+            for col in range(max(len(header), len(SHEET_COLUMN_WIDTHS))):
+                width = SHEET_COLUMN_WIDTHS[col] if col < len(SHEET_COLUMN_WIDTHS) else None
+                num_format = SHEET_COLUMN_NUM_FORMATS.get(col)
+                col_format = wb.add_format({**SHEET_CELL_FORMAT, "num_format": num_format}) if num_format else cell_format
+                ws.set_column(col, col, width, col_format)
+            ws.write_row(0, 0, header, wb.add_format(SHEET_HEADER_FORMAT))
+            write_row = ws.write_row
+            last_row = 0
+            for last_row, (*row, extra) in enumerate(con.execute("SELECT * FROM jobs ORDER BY rowid DESC"), 1):
+                write_row(last_row, 0, row + json.loads(extra) if extra else row, cell_format)
+            if last_row:
+                first_col, last_col = SHEET_DUPLICATE_COLUMNS
+                ws.conditional_format(1, first_col, last_row, last_col, {
+                    "type": "duplicate", "format": wb.add_format(SHEET_DUPLICATE_FORMAT)
+                })
+            self._emit_progress(95, force=True)
+            wb.close()
+            os.replace(tmp_name, file_name)
+            con.execute("INSERT OR REPLACE INTO meta VALUES ('xlsx_mtime', ?)", (_xlsx_mtime(),))
+            con.commit()
+        finally:
+            con.close()
+        return file_name
 
 # ---------------------------------------------------------------------------
 # GUI – with dark theme for QMessageBox + Copy Logs button in success popup
@@ -155,7 +669,7 @@ class ScraperApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Scrapify — Job Scraper")
-        self.setFixedSize(560, 520)
+        self.setFixedSize(560, 550)
         self.setStyleSheet("""
             QMainWindow { background-color: #1e1e1e; }
             QLabel { color: #e0e0e0; font-size: 14px; font-family: -apple-system, sans-serif; }
@@ -164,11 +678,12 @@ class ScraperApp(QMainWindow):
             QRadioButton { color: #ccc; font-size: 13px; spacing: 6px; }
             QRadioButton::indicator { width: 16px; height: 16px; border-radius: 8px; border: 2px solid #555; background: #2a2a2a; }
             QRadioButton::indicator:checked { background: #0a84ff; border-color: #0a84ff; }
+            QCheckBox { color: #ccc; font-size: 13px; spacing: 6px; }
             QComboBox { background-color: #2a2a2a; color: #e0e0e0; border: 1px solid #444; border-radius: 8px; padding: 6px 10px; font-size: 13px; }
             QComboBox:disabled { background-color: #1e1e1e; color: #555; border-color: #333; }
             QProgressBar { height: 14px; border-radius: 7px; background: #2a2a2a; text-align: center; color: #aaa; font-size: 11px; }
             QProgressBar::chunk { background-color: #0a84ff; border-radius: 7px; }
-            QTextEdit { background-color: #121212; color: #d0d0d0; border: none; border-radius: 10px; padding: 10px; font-family: Consolas, monospace; font-size: 12px; }
+            QPlainTextEdit { background-color: #121212; color: #d0d0d0; border: none; border-radius: 10px; padding: 10px; font-family: Consolas, monospace; font-size: 12px; }
             QPushButton { background-color: #0a84ff; color: white; border: none; border-radius: 12px; padding: 12px; font-size: 15px; font-weight: 600; }
             QPushButton:hover { background-color: #0070e0; }
             QPushButton:disabled { background-color: #444; color: #888; }
@@ -212,14 +727,9 @@ class ScraperApp(QMainWindow):
         self.company_combo = QComboBox()
         self.company_combo.setFixedHeight(30)
         self.company_combo.setEnabled(False)
-        parsers_folder = "parsers"
-        available_companies = []
-        if os.path.exists(parsers_folder):
-            for file in os.listdir(parsers_folder):
-                if file.endswith(".py") and file != "__init__.py":
-                    name = file[:-3].replace("_", " ").title()
-                    available_companies.append(name)
-        self.company_combo.addItems(sorted(available_companies))
+        self._companies_cache = None
+        self._run_log = []  # every log chunk of the current run, including ones the widget has dropped
+        self.company_combo.addItems(self._scan_companies())
         for name in ["Hexagon AB", "Flink Robotics"]:
             self.company_combo.addItem(f"{name} (no config)")
         single_row.addWidget(self.company_combo, stretch=1)
@@ -227,6 +737,9 @@ class ScraperApp(QMainWindow):
         mode_group.setLayout(mode_layout)
         layout.addWidget(mode_group)
 
+        self.csv_check = QCheckBox(f"Save as CSV (automatic above {CSV_AUTO_THRESHOLD} jobs)")
+        layout.addWidget(self.csv_check)
+
         self.status_label = QLabel("Ready")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setStyleSheet("color: #888; font-size: 12px;")
@@ -238,9 +751,14 @@ class ScraperApp(QMainWindow):
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
 
-        self.log_text = QTextEdit()
+        # Plain-text, append-only log: no rich-text layout per appended batch
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
         layout.addWidget(self.log_text, stretch=1)
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(LOG_DRAIN_MS)
+        self.log_timer.timeout.connect(self._drain_log)
 
         self.scrape_button = QPushButton("Run Scraper")
         self.scrape_button.setFixedHeight(46)
@@ -254,16 +772,25 @@ class ScraperApp(QMainWindow):
     def _on_mode_changed(self):
         self.company_combo.setEnabled(self.radio_single.isChecked())
 
+    def _scan_companies(self):
+        """Company names for parsers/*.py ("_" files are shared helpers); the folder is scanned once."""
+        if self._companies_cache is None:
+            companies = []
+            try:
+                with os.scandir("parsers") as entries:
+                    companies = [
+                        entry.name[:-3].replace("_", " ").title()
+                        for entry in entries
+                        if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+                    ]
+            except FileNotFoundError:
+                pass
+            self._companies_cache = sorted(companies)
+        return self._companies_cache
+
     def _get_selected_companies(self):
         if self.radio_all.isChecked():
-            companies = []
-            parsers_folder = "parsers"
-            if os.path.exists(parsers_folder):
-                for file in os.listdir(parsers_folder):
-                    if file.endswith(".py") and file != "__init__.py":
-                        name = file[:-3].replace("_", " ").title()
-                        companies.append(name)
-            return sorted(companies)
+            return list(self._scan_companies())
         else:
             chosen = self.company_combo.currentText()
             if chosen.endswith("(no config)"):
@@ -282,15 +809,28 @@ class ScraperApp(QMainWindow):
         self.progress_bar.setValue(0)
         self.status_label.setText("Starting…")
         self.log_text.clear()
+        self._run_log = []
 
-        self.worker = Worker(companies)
+        self.worker = Worker(companies, csv_output=self.csv_check.isChecked())
         self.worker.progress.connect(self.progress_bar.setValue)
         self.worker.status.connect(self.status_label.setText)
-        self.worker.log.connect(self.log_text.append)
         self.worker.finished.connect(self.scraper_finished)
-        self.worker.start()
+        self.log_timer.start()
+        QThreadPool.globalInstance().start(self.worker)
+
+    def _drain_log(self):
+        """Append everything the worker queued since the last tick in one widget update."""
+        log_queue = self.worker.log_queue
+        batch = []
+        while not log_queue.empty():
+            batch.append(log_queue.get_nowait())
+        if batch:
+            self._run_log.extend(batch)
+            self.log_text.appendPlainText("\n".join(batch))
 
     def scraper_finished(self, success: bool, message: str, errors: list):
+        self.log_timer.stop()
+        self._drain_log()  # the worker queued its last lines before emitting finished
         self.progress_bar.setValue(100 if success else self.progress_bar.value())
         self.scrape_button.setEnabled(True)
         self.progress_bar.setVisible(False)
@@ -309,7 +849,7 @@ class ScraperApp(QMainWindow):
 
             # Check which button was clicked
             if msg.clickedButton() == copy_btn:
-                logs = self.log_text.toPlainText()
+                logs = "\n".join(self._run_log)
                 pyperclip.copy(logs)
                 QMessageBox.information(self, "Copied", "Full logs copied to clipboard.")
         else:
@@ -321,7 +861,10 @@ class ScraperApp(QMainWindow):
             QMessageBox.warning(self, "Scraping Issues", error_text + "\n\nCopy this text if you want to report/fix them.")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # parse pool children in the PyInstaller build
     app = QApplication(sys.argv)
+    QThreadPool.globalInstance().setMaxThreadCount(4)  # bounds concurrent scrape runs
+    app.aboutToQuit.connect(SESSION.close)  # release pooled sockets (and the cache db) on exit
     window = ScraperApp()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
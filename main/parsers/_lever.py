@@ -0,0 +1,45 @@
+import html
+import re
+from urllib.parse import urljoin
+from lxml import etree
+from lxml.html import HtmlElement
+from parsers._util import build_listing_parser, build_tree, has_classes_xpath, text_lines
+
+# Lever job boards (jobs.lever.co/<company>) share one markup; XPaths are compiled once at import
+LISTING_SPEC = {
+    "item": f"//div[{has_classes_xpath(['posting'])}]",
+    "title": "normalize-space(.//h5)",
+    "link": f"string(.//a[{has_classes_xpath(['posting-title'])}]/@href)",
+    "base": "https://jobs.lever.co/",
+}
+listing_from_tree = build_listing_parser(LISTING_SPEC)
+# Exactly class="section page-centered" (BeautifulSoup's class_="section page-centered"): the header
+# ("section page-centered posting-header") and apply ("... last-section-apply") blocks are not description
+SECTIONS_XPATH = etree.XPath("//div[normalize-space(@class)='section page-centered']")
+
+# Listing fast path over the raw bytes: <a class="posting-title" href="..."> ... <h5>Title</h5>
+# The class and href must be whole attributes (not data-href=) and posting-title a whole class name
+POSTING_RE = re.compile(
+    rb'<a\b([^>]*\sclass="(?:[^"]*\s)?posting-title(?:\s[^"]*)?"[^>]*)>(?:(?!</a>).)*?<h5\b[^>]*>(.*?)</h5>',
+    re.S
+)
+HREF_RE = re.compile(rb'(?:^|\s)href="([^"]+)"')
+TAG_RE = re.compile(rb"<[^>]+>")
+
+
+def listing_parser(page: bytes):
+    """One regex scan of the listing bytes; the lxml walk (listing_from_tree) only runs if the markup changed."""
+    jobs = []
+    for attrs, inner in POSTING_RE.findall(page):
+        href = HREF_RE.search(attrs)
+        # Whitespace collapsed like the tree path's normalize-space()
+        title = " ".join(html.unescape(TAG_RE.sub(b"", inner).decode("utf-8", errors="replace")).split())
+        if href and title:
+            href = html.unescape(href.group(1).decode("utf-8", errors="replace"))
+            jobs.append((title, urljoin(LISTING_SPEC["base"], href)))
+    return jobs or listing_from_tree(build_tree(page, "lxml", encoding="utf-8"))
+
+
+def detail_parser(detail_tree: HtmlElement):
+    # Empty sections are skipped so they do not leave stray blank separators
+    return "\n\n".join(t for t in (text_lines(section) for section in SECTIONS_XPATH(detail_tree)) if t)
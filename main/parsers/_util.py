@@ -0,0 +1,148 @@
+try:
+    import orjson as json  # pip install orjson (decodes bytes directly, several times faster)
+except ImportError:
+    import json
+import codecs
+import re
+import threading
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+from lxml.html import HtmlElement
+
+# BeautifulSoup backend. "lxml" is the C-backed libxml2 parser (pip install lxml). lxml is a hard
+# dependency (compiled XPaths, lxml.html trees), so there is no "html.parser" fallback to switch to.
+HTML_PARSER = "lxml"
+
+_thread_local = threading.local()
+_NEWLINES_RE = re.compile(r"\s*[\r\n]+\s*")
+_CHARSET_RE = re.compile(r"""charset=["']?([\w.:-]+)""", re.I)
+
+
+def header_charset(headers):
+    """
+    Charset declared in the Content-Type header, else None. Unlike response.text this never
+    runs charset detection over the body, and unlike response.encoding it does not invent
+    ISO-8859-1 for text/html without a charset (which would override a <meta charset>).
+    A name Python does not know is dropped too, leaving the parser to sniff the bytes.
+    """
+    match = _CHARSET_RE.search(headers.get("Content-Type", ""))
+    if not match:
+        return None
+    try:
+        codecs.lookup(match.group(1))
+    except LookupError:
+        return None
+    return match.group(1)
+
+
+def keyword_matcher(keywords, ignore_case: bool = False):
+    """
+    Compile `keywords` once into a test `matches(text) -> bool` ("does any keyword occur in text"),
+    replacing any(kw in text for kw in keywords): one regex alternation, scanning the text once in C.
+    `ignore_case` saves lowering (copying) every text before the test.
+    """
+    return re.compile("|".join(map(re.escape, keywords)), re.I if ignore_case else 0).search
+
+
+def _lxml_parser(encoding=None):
+    """
+    This thread's lxml HTML parser for `encoding`. collect_ids=False skips the id -> element hash
+    no parser here uses. lxml parsers must not be shared between threads, but can be reused within one.
+    """
+    parsers = _thread_local.__dict__.setdefault("lxml_parsers", {})
+    parser = parsers.get(encoding)
+    if parser is None:
+        # libxml2 knows fewer spellings than Python ("latin-1" only as "iso8859-1", no "utf-8-sig"):
+        # try the Python codec's canonical name, then let the parser sniff the bytes
+        for name in (encoding, encoding and codecs.lookup(encoding).name, None):
+            try:
+                parser = lxml_html.HTMLParser(encoding=name, collect_ids=False)
+                break
+            except LookupError:
+                continue
+        parsers[encoding] = parser
+    return parser
+
+
+def build_tree(content: bytes, kind: str = "soup", strainer=None, encoding=None):
+    """
+    Parse response bytes into what a parser asks for via CONFIG["listing_tree"] / CONFIG["detail_tree"]:
+    "lxml" hands over a bare lxml.html element (no BeautifulSoup wrapper objects),
+    "json" the decoded payload of a JSON API (no HTML parse at all),
+    "raw" the undecoded bytes (for regex fast paths that fall back to build_tree themselves),
+    anything else a BeautifulSoup object, restricted to `strainer` (a SoupStrainer) if given.
+    `encoding` (from header_charset) saves the parser from sniffing the bytes itself.
+    """
+    if kind == "lxml":
+        return lxml_html.fromstring(content, parser=_lxml_parser(encoding))
+    if kind == "json":
+        return json.loads(content)
+    if kind == "raw":
+        return content
+    return BeautifulSoup(content, HTML_PARSER, parse_only=strainer, from_encoding=encoding)
+
+
+def has_classes_xpath(classes):
+    """
+    XPath predicate matching elements whose class attribute contains every name in `classes`, in any
+    order and among others (CSS ".a.b"). For one name this is BeautifulSoup's class_="a"; it is not
+    class_="a b", which compares the whole attribute value - use normalize-space(@class)='a b' for that.
+    """
+    return " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')" for cls in classes
+    )
+
+
+def build_listing_parser(spec):
+    """
+    Specialise a listing parser for a fixed page shape. `spec` holds XPaths: "item" (one node per job),
+    and per item "title" and "link" as string expressions (e.g. "normalize-space(.//h5)", "string(.//a/@href)");
+    optional "base" makes links absolute. Expressions are compiled once; the returned function takes an
+    lxml tree and gives [(title, url)], skipping items without a title or link.
+    """
+    item_xpath = etree.XPath(spec["item"])
+    title_xpath = etree.XPath(spec["title"])
+    link_xpath = etree.XPath(spec["link"])
+    base = spec.get("base")
+
+    def parser(tree: HtmlElement):
+        jobs = []
+        for item in item_xpath(tree):
+            title = title_xpath(item).strip()
+            href = link_xpath(item).strip()
+            if title and href:
+                jobs.append((title, urljoin(base, href) if base else href))
+        return jobs
+
+    return parser
+
+
+def strip_non_content(tree: HtmlElement):
+    """Drop <script>/<style>/<noscript> in place; BeautifulSoup's get_text skips them, lxml's text does not."""
+    etree.strip_elements(tree, "script", "style", "noscript", with_tail=False)
+    return tree
+
+
+def iter_lines(el: HtmlElement, min_len: int = 0):
+    """Lazy clean_lines(): a caller that stops early never splits the rest of the text."""
+    return (
+        line
+        for text in el.itertext()
+        for line in _NEWLINES_RE.split(text.strip())
+        if len(line) > min_len
+    )
+
+
+def clean_lines(el: HtmlElement, min_len: int = 0):
+    """
+    Stripped, non-empty text lines of `el` longer than `min_len`, in one pass over its text nodes
+    (instead of get_text() followed by splitlines() and a strip/filter comprehension).
+    """
+    return list(iter_lines(el, min_len))
+
+
+def text_lines(el: HtmlElement):
+    """lxml counterpart of BeautifulSoup's get_text(separator="\\n", strip=True)."""
+    return "\n".join(clean_lines(el))
+
@@ -1,8 +1,88 @@
-from bs4 import BeautifulSoup
-
-def listing_parser(soup):
+import html
+import re
+from itertools import takewhile
+from urllib.parse import urljoin, urlsplit
+from bs4 import SoupStrainer
+from lxml import etree
+from parsers._util import (
+    build_tree, clean_lines, has_classes_xpath, iter_lines, keyword_matcher, strip_non_content
+)
+
+# Framer renders each job card as <a href="..."> ... <hN>Title</hN> ... </a>, sometimes as
+# <hN><a href="...">Title</a></hN>. The fast path scans the raw HTML once for anchor open/close tags
+# and whole headings (skipping comments, scripts and styles), in document order like the soup walk.
+_TOKEN_RE = re.compile(
+    r'<!--.*?-->|<(script|style)\b.*?</\1\s*>'
+    r'|<a\b([^>]*)>|</a\s*>'
+    r'|<(h[1-6])\b[^>]*>(.*?)</\3\s*>',
+    re.I | re.S
+)
+_INNER_A_RE = re.compile(r"<a\b([^>]*)>", re.I)
+_HREF_RE = re.compile(r"""(?:^|\s)href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+# The soup fallback only walks headings and their enclosing/inner links; anchors keep their whole subtree
+_LISTING_STRAINER = SoupStrainer(['a', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# Markers of navigation/footer text, matched case-insensitively so no lowered copy of the text is made
+_JUNK_WORDS = ('footer', '©', 'all rights reserved', 'privacy policy', 'cookie', 'imprint')
+_CUTOFF_KEYWORDS = ('©', 'all rights reserved', 'privacy', 'cookie', 'imprint', 'contact us', 'back to top')
+_has_junk = keyword_matcher(_JUNK_WORDS, ignore_case=True)
+_has_cutoff = keyword_matcher(_CUTOFF_KEYWORDS, ignore_case=True)
+
+
+_BASE_URL = 'https://flexion.ai/'
+
+
+def _url_key(url):
+    """Dedupe key: the same posting linked with different ?query/#fragment counts once."""
+    return urlsplit(url)._replace(query='', fragment='').geturl()
+
+
+def _href(attrs):
+    """href value in an attribute string, or None; `data-href=` and the like do not count."""
+    match = _HREF_RE.search(attrs)
+    if not match:
+        return None
+    return html.unescape(next(value for value in match.groups() if value is not None))
+
+
+def listing_parser(page: bytes):
     """
     Find job cards/titles/links on https://flexion.ai/careers
+    Fast path: one regex pass over the raw HTML, with the same rules as _listing_from_soup (every
+    heading, its enclosing or inner link); falls back to the soup walk if it finds nothing.
+    """
+    jobs = []
+    seen_urls = set()
+    open_href = None  # href of the <a> the scan is currently inside
+    for match in _TOKEN_RE.finditer(page.decode("utf-8", errors="replace")):
+        anchor_attrs, heading = match.group(2), match.group(3)
+        if anchor_attrs is not None:
+            open_href = _href(anchor_attrs)
+            continue
+        if heading is None:
+            if match.group(0)[:2] == "</":
+                open_href = None
+            continue
+        inner = match.group(4)
+        href = open_href
+        if href is None:
+            href = next((h for h in map(_href, _INNER_A_RE.findall(inner)) if h is not None), None)
+            if href is None:
+                continue
+        title = "".join(html.unescape(piece).strip() for piece in _TAG_RE.split(inner))
+        if len(title) < 8:
+            continue
+        href = urljoin(_BASE_URL, href)
+        key = _url_key(href)
+        if key not in seen_urls:
+            seen_urls.add(key)
+            jobs.append((title, href))
+    return jobs or _listing_from_soup(build_tree(page, strainer=_LISTING_STRAINER))
+
+
+def _listing_from_soup(soup):
+    """
     Framer sites often use h tags inside links or cards.
     """
     jobs = []
@@ -19,63 +99,61 @@ def listing_parser(soup):
         if not title or len(title) < 8:
             continue
 
-        href = link_tag['href']
-        if not href.startswith('http'):
-            href = 'https://flexion.ai' + (href if href.startswith('/') else '/' + href)
+        href = urljoin(_BASE_URL, link_tag['href'])
 
-        if href not in seen_urls:
-            seen_urls.add(href)
+        key = _url_key(href)
+        if key not in seen_urls:
+            seen_urls.add(key)
             jobs.append((title, href))
 
     return jobs
 
 
-def detail_parser(detail_soup):
+# Possible good containers (ordered by likelihood), compiled once at import
+_CANDIDATE_XPATHS = [
+    etree.XPath(xpath) for xpath in (
+        '//div[@data-block-type="text"]',           # Framer text block
+        f'//div[{has_classes_xpath(["job-description"])}]',
+        f'//div[{has_classes_xpath(["description"])}]',
+        '//article',
+        f'//div[{has_classes_xpath(["content"])}]',
+        '//main',
+    )
+]
+
+
+def detail_parser(detail_tree):
     """
     Extract only the job description part on Flexion detail pages.
     Avoids header, footer, sidebar, navigation, etc.
     """
-    # Possible good containers (ordered by likelihood)
-    candidates = [
-        detail_soup.select_one('div[data-block-type="text"]'),           # Framer text block
-        detail_soup.select_one('div.job-description'),
-        detail_soup.select_one('div.description'),
-        detail_soup.select_one('article'),
-        detail_soup.select_one('div.content'),
-        detail_soup.select_one('main'),
-    ]
-
-    for candidate in candidates:
+    strip_non_content(detail_tree)
+
+    # Evaluated one at a time, so the search stops at the first good container
+    for xpath in _CANDIDATE_XPATHS:
+        candidate = xpath(detail_tree)
         if not candidate:
             continue
 
         # Clean and filter
-        text = candidate.get_text(separator='\n', strip=True)
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        lines = clean_lines(candidate[0])
+        text = '\n'.join(lines)
 
         # Skip if too short or looks like navigation/footer
-        if len(lines) < 5 or any(
-            word in text.lower() for word in ['footer', '©', 'all rights reserved', 'privacy policy', 'cookie', 'imprint']
-        ):
+        if len(lines) < 5:
+            continue
+        if _has_junk(text):
             continue
 
         # Good candidate if long enough
         if len(text) > 300:
             return text
 
-    # Last resort: whole page but aggressive filtering
-    full_text = detail_soup.get_text(separator='\n', strip=True)
-    lines = [l.strip() for l in full_text.splitlines() if len(l.strip()) > 15]
-
-    # Try to cut off footer/nav by looking for common ending markers
-    cutoff_keywords = ['©', 'all rights reserved', 'privacy', 'cookie', 'imprint', 'contact us', 'back to top']
-    filtered_lines = []
-    for line in lines:
-        if any(kw in line.lower() for kw in cutoff_keywords):
-            break
-        filtered_lines.append(line)
-
-    cleaned = '\n'.join(filtered_lines)
+    # Last resort: whole page but aggressive filtering.
+    # Lines are produced lazily and cut off at the first footer/nav marker, so the rest is never split.
+    cleaned = '\n'.join(
+        takewhile(lambda line: not _has_cutoff(line), iter_lines(detail_tree, min_len=15))
+    )
     if len(cleaned) > 200:
         return cleaned
 
@@ -87,5 +165,7 @@ CONFIG = {
     "headers": {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
     },
+    "listing_tree": "raw",
+    "detail_tree": "lxml",
     "note": "Framer site – improved filtering to avoid header/footer noise"
 }
\ No newline at end of file
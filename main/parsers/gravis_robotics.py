@@ -1,53 +1,56 @@
-from bs4 import BeautifulSoup
-
-def listing_parser(soup: BeautifulSoup):
-    jobs = []
-    for post in soup.find_all("div", class_="posting"):
-        title_elem = post.find("h5")
-        if not title_elem:
-            continue
-        title = title_elem.text.strip()
-        link_elem = post.find("a", class_="posting-title")
-        if not link_elem or not link_elem.get("href"):
-            continue
-        jobs.append((title, link_elem["href"]))
-    return jobs
-
-def detail_parser(detail_soup: BeautifulSoup):
+import re
+from lxml import etree
+from lxml.html import HtmlElement
+from parsers._lever import listing_parser
+from parsers._util import has_classes_xpath, strip_non_content, text_lines
+
+# XPaths compiled once at import
+# Primary: exactly class="section-wrapper page-centered", not every element carrying both classes
+_SECTIONS_XPATH = etree.XPath("//div[normalize-space(@class)='section-wrapper page-centered']")
+# Fallback containers, most specific first
+_FALLBACK_XPATHS = [
+    etree.XPath(xpath) for xpath in (
+        f"//div[{has_classes_xpath(['section-wrapper'])}]",
+        f"//div[{has_classes_xpath(['posting-page-description'])}]",
+        f"//div[{has_classes_xpath(['description'])}]",
+        f"//div[{has_classes_xpath(['job-description'])}]",
+        "//article",
+        "//main",
+        "//body"
+    )
+]
+# Full-page fallback: drop lines of <= 5 chars and the apply button
+_DROP_LINE_RE = re.compile(r"^(?:.{0,5}|Apply for this job.*)(?:\n|\Z)", re.M)
+
+
+def _joined_text(elements):
+    return "\n\n".join(t for t in (text_lines(el) for el in elements) if t)
+
+
+def detail_parser(detail_tree: HtmlElement):
+    strip_non_content(detail_tree)
+
     # Primary selector
-    sections = detail_soup.find_all("div", class_="section-wrapper page-centered")
+    sections = _SECTIONS_XPATH(detail_tree)
     if sections:
-        return "\n\n".join(
-            s.get_text(separator="\n", strip=True) for s in sections
-        )
+        return _joined_text(sections)
 
     # Fallback selectors
-    fallback_selectors = [
-        "div.section-wrapper",
-        "div.posting-page-description",
-        "div.description",
-        "div.job-description",
-        "article",
-        "main",
-        "body"
-    ]
-    for selector in fallback_selectors:
-        elements = detail_soup.find_all(selector)
-        text = "\n\n".join(
-            el.get_text(separator="\n", strip=True) for el in elements
-        )
-        if text.strip() and len(text) > 200:
+    # Evaluated one at a time, so the search stops at the first selector with enough text
+    for xpath in _FALLBACK_XPATHS:
+        text = _joined_text(xpath(detail_tree))
+        if len(text) > 200:
             return text
 
     # Cleaned full page fallback
-    full_text = detail_soup.get_text(separator="\n", strip=True)
-    lines = [l.strip() for l in full_text.splitlines() if len(l.strip()) > 5 and not l.startswith("Apply for this job")]
-    return "\n".join(lines)
+    return _DROP_LINE_RE.sub("", text_lines(detail_tree)).rstrip("\n")
 
 CONFIG = {
     "url": "https://jobs.lever.co/gravisrobotics",
     "headers": {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
     },
+    "listing_tree": "raw",
+    "detail_tree": "lxml",
     "note": "Lever.co - enhanced fallbacks for description extraction"
 }
\ No newline at end of file
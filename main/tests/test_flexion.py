@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from parsers import flexion_robotics  # noqa: E402
+from parsers._util import build_tree  # noqa: E402
+
+# Framer-style careers page covering every card shape the soup walk understands
+LISTING = """<html><head><script>var t = "<h2><a href='/js'>Not a job heading</a></h2>";</script></head><body>
+<a class="card" href="/careers/robotics-engineer"><div><h3>Robotics Engineer</h3><p>Zurich</p></div></a>
+<h2><a href="/careers/controls-engineer?ref=list">Controls Engineer</a></h2>
+<a href="/careers/controls-engineer#apply"><h3>Controls Engineer (again)</h3></a>
+<a href="/careers/y"><h4>Short</h4><h4>A long second heading</h4></a>
+<a data-href="/x" class="card" href="/careers/software"><h3>Software &amp; ML  Engineer</h3></a>
+<a href='https://other.example/jobs/1'><h5><span>Field</span> <b>Technician</b></h5></a>
+<!-- <a href="/careers/commented"><h3>Commented out job</h3></a> -->
+<h2>Open positions without a link</h2>
+<a name="anchor-only"><h3><a href="/careers/inner-link">Heading with inner link</a></h3></a>
+</body></html>""".encode()
+
+
+def test_fast_path_matches_soup_walk():
+    expected = flexion_robotics._listing_from_soup(build_tree(LISTING, strainer=flexion_robotics._LISTING_STRAINER))
+    assert flexion_robotics.listing_parser(LISTING) == expected
+    assert ("A long second heading", "https://flexion.ai/careers/y") in expected
+    assert ("Controls Engineer", "https://flexion.ai/careers/controls-engineer?ref=list") in expected
+    assert ("Software & ML  Engineer", "https://flexion.ai/careers/software") in expected
@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from parsers import gravis_robotics, rivr  # noqa: E402
+from parsers._lever import listing_from_tree  # noqa: E402
+from parsers._util import build_tree  # noqa: E402
+
+# Trimmed-down Lever posting page: header and apply blocks carry the section classes plus one more
+LEVER_DETAIL = b"""<html><body>
+<div class="section page-centered posting-header">
+  <h2>Robot Engineer</h2><div>Zurich</div><a>Apply for this job</a>
+</div>
+<div class="section page-centered"><p>We build robots.</p></div>
+<div class="section  page-centered"><h3>Requirements</h3><ul><li>Python</li></ul></div>
+<div class="section page-centered last-section-apply"><a>Apply for this job</a></div>
+</body></html>"""
+
+
+def test_detail_parser_keeps_only_description_sections():
+    assert rivr.detail_parser(build_tree(LEVER_DETAIL, "lxml")) == "We build robots.\n\nRequirements\nPython"
+
+
+def test_gravis_primary_selector_matches_exact_class():
+    page = LEVER_DETAIL.replace(b"section page-centered", b"section-wrapper page-centered")
+    page = page.replace(b"section  page-centered", b"section-wrapper page-centered")
+    assert gravis_robotics.detail_parser(build_tree(page, "lxml")) == "We build robots.\n\nRequirements\nPython"
+
+
+LEVER_LISTING = b"""<html><body>
+<div class="postings-group">
+  <div class="posting" data-qa-posting-id="abc">
+    <div class="posting-apply"><a href="https://jobs.lever.co/rivr/abc/apply" class="posting-btn-submit">Apply</a></div>
+    <a class="posting-title" href="https://jobs.lever.co/rivr/abc"><h5 data-qa="posting-name">Robot
+      Engineer</h5><div class="posting-categories">Zurich</div></a>
+  </div>
+  <div class="posting">
+    <a data-href="/x" class="posting-title" href="/rivr/def"><h5>Controls &amp; Autonomy Lead</h5></a>
+  </div>
+  <div class="posting">
+    <a class="posting-title-icon" href="/rivr/icon">&#8599;</a>
+    <a class="posting-title" href="https://jobs.lever.co/rivr/ghi"><h5>Field <span>Technician</span></h5></a>
+  </div>
+</div>
+</body></html>"""
+
+
+def test_listing_fast_path_matches_tree_walk():
+    jobs = rivr.listing_parser(LEVER_LISTING)
+    assert jobs == listing_from_tree(build_tree(LEVER_LISTING, "lxml", encoding="utf-8"))
+    assert jobs == [
+        ("Robot Engineer", "https://jobs.lever.co/rivr/abc"),
+        ("Controls & Autonomy Lead", "https://jobs.lever.co/rivr/def"),
+        ("Field Technician", "https://jobs.lever.co/rivr/ghi"),
+    ]